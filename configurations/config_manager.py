@@ -1,7 +1,15 @@
 import json
+import pickle
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# orjson is optional; it parses noticeably faster than the standard library
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class ConfigManager:
     """
     A master class to find, load, and manage all configuration files for the pipeline.
@@ -11,6 +19,8 @@ class ConfigManager:
     # Define filepaths internally as class attributes
     _EXTRACTION_CONFIG_PATH = Path("configurations/config_data_extract.json")
     _REPORTING_CONFIG_PATH = Path("configurations/config_data_reports.json")
+    # Fully hydrated configurations are cached here between runs
+    _CACHE_PATH = Path(".cache/config_cache.pkl")
 
     def __init__(self):
         """
@@ -30,13 +40,23 @@ class ConfigManager:
         Returns:
             dict or list: The loaded JSON data, or None if the file doesn't exist.
         """
-        if not file_path.is_file():
-            print(f"INFO: {description} file not found at '{file_path}'.")
-            return None
+        # Open directly instead of probing with is_file() first; a missing file is
+        # reported from the exception, saving a stat() per config file.
         try:
+            if orjson is not None:
+                return orjson.loads(file_path.read_bytes())
             with open(file_path, 'r', encoding='utf-8') as f:
                 return json.load(f)
+        except (FileNotFoundError, IsADirectoryError, PermissionError) as e:
+            # Windows raises PermissionError rather than IsADirectoryError for a directory;
+            # a file that really cannot be read is still fatal
+            if isinstance(e, PermissionError) and not file_path.is_dir():
+                print(f"❌ FATAL: Could not read {file_path}. Reason: {e}")
+                sys.exit(1)
+            print(f"INFO: {description} file not found at '{file_path}'.")
+            return None
         except json.JSONDecodeError:
+            # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
             print(f"❌ FATAL: '{file_path}' is not a valid JSON file.")
             sys.exit(1)
         except Exception as e:
@@ -53,10 +73,17 @@ class ConfigManager:
 
         print("Hydrating extraction configuration from linked files...")
 
-        # Load Aliases from the path specified *inside* the main extraction config
         aliases_path_str = self.extraction_config.get("data_aliases_config_filepath")
-        if aliases_path_str:
-            aliases_config = self._load_json_file(Path(aliases_path_str), "Data Aliases")
+        tables_path_str = self.extraction_config.get("data_tables_config_filepath")
+
+        # Both sub-configs are read concurrently so their file I/O overlaps
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            aliases_future = executor.submit(self._load_json_file, Path(aliases_path_str), "Data Aliases") if aliases_path_str else None
+            tables_future = executor.submit(self._load_json_file, Path(tables_path_str), "Data Tables") if tables_path_str else None
+
+        # Load Aliases from the path specified *inside* the main extraction config
+        if aliases_future:
+            aliases_config = aliases_future.result()
             if aliases_config is not None:
                 self.extraction_config["files_to_process"] = aliases_config
                 print(f"  - Loaded {len(aliases_config)} file aliases from '{aliases_path_str}'")
@@ -64,21 +91,86 @@ class ConfigManager:
             print("  - WARNING: 'data_aliases_config_filepath' not found in extraction config.")
 
         # Load Tables from the path specified *inside* the main extraction config
-        tables_path_str = self.extraction_config.get("data_tables_config_filepath")
-        if tables_path_str:
-            tables_config = self._load_json_file(Path(tables_path_str), "Data Tables")
+        if tables_future:
+            tables_config = tables_future.result()
             if tables_config is not None:
                 self.extraction_config["tables_to_extract"] = tables_config
                 print(f"  - Loaded {len(tables_config)} table definitions from '{tables_path_str}'")
         else:
             print("  - WARNING: 'data_tables_config_filepath' not found in extraction config.")
 
+    @staticmethod
+    def _get_mtime(file_path):
+        """Returns the modification time of a file, or None if it does not exist."""
+        try:
+            return file_path.stat().st_mtime
+        except OSError:
+            return None
+
+    def _get_source_paths(self):
+        """Returns every configuration file that contributes to the loaded configs."""
+        source_paths = [self.extraction_config_path, self.reporting_config_path]
+        if self.extraction_config:
+            for key in ("data_aliases_config_filepath", "data_tables_config_filepath"):
+                path_str = self.extraction_config.get(key)
+                if path_str:
+                    source_paths.append(Path(path_str))
+        return source_paths
+
+    def _load_from_cache(self):
+        """
+        Restores the hydrated configurations from the cache file, provided that
+        none of the configuration files have changed since it was written.
+
+        Returns:
+            bool: True if the configurations were restored from the cache.
+        """
+        if not self._CACHE_PATH.is_file():
+            return False
+        try:
+            with open(self._CACHE_PATH, 'rb') as f:
+                cached = pickle.load(f)
+            source_mtimes = cached["source_mtimes"]
+            for path_str, mtime in source_mtimes.items():
+                if self._get_mtime(Path(path_str)) != mtime:
+                    return False
+            self.extraction_config = cached["extraction"]
+            self.reporting_config = cached["reporting"]
+        except Exception:
+            # A missing, stale or unreadable cache just means a full reload
+            return False
+        return True
+
+    def _save_to_cache(self):
+        """Writes the hydrated configurations and their source file mtimes to the cache file."""
+        cached = {
+            "source_mtimes": {str(path): self._get_mtime(path) for path in self._get_source_paths()},
+            "extraction": self.extraction_config,
+            "reporting": self.reporting_config,
+        }
+        try:
+            self._CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._CACHE_PATH, 'wb') as f:
+                pickle.dump(cached, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            print(f"WARNING: Could not write configuration cache to '{self._CACHE_PATH}'. Reason: {e}")
+
     def load_all(self):
-        """Loads all primary and secondary configuration files."""
+        """
+        Loads all primary and secondary configuration files. If none of them have
+        changed since the previous run, the hydrated configurations are restored
+        from the cache instead of re-parsing the JSON files.
+        """
         print("--- ⚙️ Loading Configurations ---")
+        if self._load_from_cache():
+            print(f"  - Configuration files unchanged; loaded from cache '{self._CACHE_PATH}'")
+            print("--- ✅ Configurations Loaded ---")
+            return
+
         self.extraction_config = self._load_json_file(self.extraction_config_path, "Extraction config")
         self.reporting_config = self._load_json_file(self.reporting_config_path, "Reporting config")
         
         # Hydrate the extraction config with its linked sub-configs
         self._hydrate_extraction_config()
+        self._save_to_cache()
         print("--- ✅ Configurations Loaded ---")
\ No newline at end of file
@@ -2,7 +2,7 @@ import sys
 from pathlib import Path
 import shutil
 from configurations.config_manager import ConfigManager
-from util.extractor import run_extraction
+from util.extractor import run_extraction, select_files_to_process
 from util.reporter import run_reporting
 
 
@@ -41,10 +41,14 @@ def main():
     # --- Step 1: Data Extraction ---
     if extraction_config and extraction_config.get("run_flags", {}).get("CONDUCT_DATA_EXTRACTION", False):
         try:
-            # Initialize folder for a clean extraction run
+            # Initialize folder for a clean extraction run, unless no PRN file is selected,
+            # in which case nothing would be extracted and the existing tables are kept
             extraction_output_folder = Path(extraction_config.get("output_base_folder", "extracted_csv_tables"))
-            clear_and_create_folder(extraction_output_folder)
-            
+            if select_files_to_process(extraction_config):
+                clear_and_create_folder(extraction_output_folder)
+            else:
+                print(f"No PRN files selected for extraction; leaving '{extraction_output_folder}' untouched.")
+
             # Run the extraction process
             run_extraction(extraction_config)
         except Exception as e:
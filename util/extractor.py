@@ -1,11 +1,69 @@
 import pandas as pd
+import numpy as np
 import io
 import re
 import os
+import mmap
 import json
+import functools
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from simpledbf import Dbf5
 
+# Patterns used by the table-locator loops, compiled once at import time. Header
+# patterns are only searched on lines that contain "Route_ID" at all.
+_RE_ROUTE_COUNT_HEADER = re.compile(r"Route_ID.*Count")
+_RE_ROUTE_HOURS_HEADER = re.compile(r"Route_ID.*Hours")
+
+# Classifies the lines that end a table's data (any table title or page header)
+# in one pass over the whole file text.
+_RE_SECTION_BREAK = re.compile(r"(?P<title>Table[^\S\n]+(?P<title_id>\d+\.\d+))|(?P<page_header>Program STOPS)")
+
+# Matches exactly the strings float() accepts (digits with optional '_' separators,
+# a fraction and exponent, or inf/infinity/nan), so station-group rows can find
+# their first number without raising and catching ValueError on every label token.
+_NUMBER_DIGITS = r"\d(?:_?\d)*"
+_RE_NUMBER_TOKEN = re.compile(
+    rf"[+-]?(?:(?:{_NUMBER_DIGITS}(?:\.(?:{_NUMBER_DIGITS})?)?|\.{_NUMBER_DIGITS})(?:[eE][+-]?{_NUMBER_DIGITS})?"
+    r"|(?i:inf|infinity|nan))"
+)
+
+# Patterns used by the metadata back-scan above each table title.
+_RE_VERSION = re.compile(r'Version:\s*(\S+)\s*-\s*(\d{2}/\d{2}/\d{4})')
+_RE_RUN_SYSTEM = re.compile(r'^(.*?)(?:\s+System:\s*(.*))?$')
+_RE_PAGE = re.compile(r'Page\s+(\d+)')
+_METADATA_KEYS = frozenset(("Program", "Version", "Run", "Page"))
+
+
+@functools.lru_cache(maxsize=None)
+def _table_title_pattern(table_id):
+    """
+    Returns the compiled pattern matching the title line of the given table.
+    Whitespace after 'Table' excludes newlines so the pattern can also be
+    searched across the whole file text without matching across two lines.
+    """
+    return re.compile(r"Table[^\S\n]+" + re.escape(table_id))
+
+
+@functools.lru_cache(maxsize=None)
+def _header_pattern(pattern):
+    """
+    Returns the compiled form of a table's optional 'header_pattern' from the
+    format config, or None if the table has none.
+    """
+    return re.compile(pattern) if pattern else None
+
+
+def _is_ruler(stripped_line):
+    """
+    Returns True if a stripped line is a separator rule: two or more '=' or two
+    or more '-' characters and nothing else. Same result as fullmatching
+    '={2,}' or '-{2,}', without a regex call per data line.
+    """
+    return len(stripped_line) >= 2 and stripped_line[0] in "=-" and not stripped_line.strip(stripped_line[0])
+
+
 def _convert_dbf_files(config):
     """
     Handles the conversion of specified DBF files to CSV format based on the config.
@@ -48,7 +106,7 @@ def _convert_dbf_files(config):
                 df = dbf_data.to_dataframe()
 
                 # Save the DataFrame to a CSV file
-                df.to_csv(out_path, index=False, encoding='utf-8')
+                df.to_csv(out_path, index=False)
                 print(f"  ✅ Successfully converted and saved to: {out_path}")
 
             except Exception as e:
@@ -59,13 +117,167 @@ def _convert_dbf_files(config):
     print("--- ✅ DBF to CSV Conversion Complete ---")
 
 
+class _LineView:
+    """
+    A read-only, list-like view of the lines of a text. Each line (with its
+    newline) is sliced out of the text when it is indexed, so only the lines an
+    extractor actually visits are ever created as separate strings.
+    """
+    __slots__ = ("_text", "_offsets")
+
+    def __init__(self, text, offsets):
+        self._text = text
+        self._offsets = offsets
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("line index out of range")
+        return self._text[self._offsets[index]:self._offsets[index + 1]]
+
+
+class PRNFile:
+    """
+    The contents of a single .PRN file, read from disk once and shared by every
+    table extractor run against that file. Holds the full text and a view of
+    its lines so a table title can be located with one search over the text
+    instead of a regex call per line.
+    """
+
+    def __init__(self, file_path):
+        # Decode the file in one call straight from a memory map, so no bytes copy of
+        # the whole file is made first; PRN output is ASCII, which takes the decoder's
+        # fast path. For plain ASCII with '\n' line ends, the line offsets are found
+        # on the mapped bytes too.
+        self.line_offsets = None
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    self.text = str(mapped, 'utf-8', 'ignore')
+                    self.line_offsets = self._ascii_line_offsets(mapped)
+            else:
+                self.text = ''
+
+        if self.line_offsets is None:
+            # Normalize newlines as text mode would, then split on '\n' only, exactly
+            # like readlines(); form feeds stay in the line.
+            if '\r' in self.text:
+                self.text = self.text.replace('\r\n', '\n').replace('\r', '\n')
+            line_lengths = np.fromiter(map(len, io.StringIO(self.text)), dtype=np.int64)
+            self.line_offsets = np.zeros(len(line_lengths) + 1, dtype=np.int64)
+            np.cumsum(line_lengths, out=self.line_offsets[1:])
+        self.lines = _LineView(self.text, self.line_offsets)
+
+        # A single scan of the text finds every table title and page header line,
+        # so the extractors know where each table's section ends without testing lines.
+        # The same scan records the first title line of each table ID found, so
+        # locating any requested table needs no further search of the text.
+        self.table_title_lines = set()
+        self.page_header_lines = set()
+        self._first_title_line_by_id = {}
+        for match in _RE_SECTION_BREAK.finditer(self.text):
+            title_id = match.group("title_id")
+            if title_id is not None:
+                line_index = self._line_index_at(match.start())
+                self.table_title_lines.add(line_index)
+                self._first_title_line_by_id.setdefault(title_id, line_index)
+            else:
+                self.page_header_lines.add(self._line_index_at(match.start()))
+        section_break_lines = self.table_title_lines | self.page_header_lines
+        self._sorted_section_breaks = np.array(sorted(section_break_lines), dtype=np.int64)
+        self._metadata_by_title_line = {}
+
+    @staticmethod
+    def _ascii_line_offsets(buffer):
+        """
+        Returns the start offset of each line (plus the end of the text) as an int64
+        array, found with vectorized NumPy scans for '\n' over the raw bytes.
+        Returns None if the bytes are not plain ASCII or contain '\r', since byte
+        offsets would then not match offsets in the decoded, normalized text.
+        """
+        data = np.frombuffer(buffer, dtype=np.uint8)
+        try:
+            if data.max() >= 0x80 or (data == 0x0D).any():
+                return None
+            line_ends = np.flatnonzero(data == 0x0A) + 1
+            offsets = np.concatenate(([0], line_ends)).astype(np.int64)
+            # A last line without a trailing newline still counts, as with readlines()
+            if not line_ends.size or line_ends[-1] != len(data):
+                offsets = np.append(offsets, len(data))
+            return offsets
+        finally:
+            # Release the view so the memory map can be closed
+            del data
+
+    def _line_index_at(self, offset):
+        """Returns the index of the line containing the given character offset of the text."""
+        return int(np.searchsorted(self.line_offsets, offset, side='right')) - 1
+
+    def next_section_break(self, index):
+        """
+        Returns the index of the first section break line (table title or page
+        header) at or after the given line, or len(lines) if there is none. The
+        collectors use it to bound their scans to the current section.
+        """
+        position = np.searchsorted(self._sorted_section_breaks, index, side='left')
+        if position == len(self._sorted_section_breaks):
+            return len(self.lines)
+        return int(self._sorted_section_breaks[position])
+
+    def get_metadata(self, title_index):
+        """
+        Returns the report metadata (Program, Version, Run, Page) found above the
+        table title on the given line. Each title line is only scanned once per
+        file, however many extractors ask for it.
+        """
+        metadata = self._metadata_by_title_line.get(title_index)
+        if metadata is None:
+            metadata = StopsPRNExtractor._extract_metadata_from_prn(self.lines, title_index)
+            self._metadata_by_title_line[title_index] = metadata
+        return metadata
+
+    def iter_table_section(self, table_id):
+        """
+        Yields (line index, line, metadata) for every line from the first title
+        line of the given table to the end of the file, jumping straight to that
+        title instead of testing every line before it. metadata is the report
+        metadata above the most recent title of this table seen so far. Yields
+        nothing if the table is not in the file.
+        """
+        table_title = _table_title_pattern(table_id)
+        metadata = {}
+        for i in range(self.find_table_title(table_id), len(self.lines)):
+            line = self.lines[i]
+            if i in self.table_title_lines and table_title.search(line):
+                metadata = self.get_metadata(i)
+            yield i, line, metadata
+
+    def find_table_title(self, table_id):
+        """
+        Returns the index of the first line containing the title of the given
+        table, or len(lines) if the table is not in the file, so that a scan
+        starting from the returned index finds nothing. Like the title pattern,
+        a title whose ID starts with table_id counts as a match.
+        """
+        return min(
+            (line_index for title_id, line_index in self._first_title_line_by_id.items()
+             if title_id.startswith(table_id)),
+            default=len(self.lines),
+        )
+
+
 class StopsPRNExtractor:
     """
     A class to systematically extract tables from STOPS program .PRN output files.
     This class contains multiple static methods, each designed to parse a specific
-    table format from the text-based .PRN files.
+    table format from a text-based .PRN file loaded as a PRNFile.
     """
     _format_config = None
+    _column_schemas = {}
 
     @staticmethod
     def _get_table_format_config(config):
@@ -97,7 +309,7 @@ class StopsPRNExtractor:
     @staticmethod
     def _generate_colspecs_from_widths(widths):
         """
-        Generates a list of (start, end) tuples for pd.read_fwf from a list of widths.
+        Generates a list of (start, end) tuples for _read_fixed_width from a list of widths.
         """
         colspecs = []
         start = 0
@@ -108,247 +320,279 @@ class StopsPRNExtractor:
         return colspecs
 
     @staticmethod
-    def _extract_metadata_from_prn(lines, start_index):
-        """Extracts metadata (Program, Version, Run, etc.) from the lines preceding a table."""
-        metadata = {}
-        for meta_line_offset in range(1, 10):
-            meta_line_num = start_index - meta_line_offset
-            if meta_line_num >= 0:
-                meta_line = lines[meta_line_num].strip()
-                if "Program STOPS" in meta_line:
-                    program_version_parts = meta_line.split(" - ", 1)
-                    if len(program_version_parts) > 0:
-                        metadata["Program"] = program_version_parts[0].replace("Program ", "").strip()
-                    if len(program_version_parts) > 1 and "Version:" in program_version_parts[1]:
-                        version_match = re.search(r'Version:\s*(\S+)\s*-\s*(\d{2}/\d{2}/\d{4})', program_version_parts[1])
-                        if version_match:
-                            metadata["Version"] = f"{version_match.group(1)} - {version_match.group(2)}"
-                        else:
-                            metadata["Version"] = program_version_parts[1].split("Version: ")[1].split(" - ")[0].strip()
-                elif "Version:" in meta_line:
-                        version_match = re.search(r'Version:\s*(\S+)\s*-\s*(\d{2}/\d{2}/\d{4})', meta_line)
-                        if version_match:
-                                metadata["Version"] = f"{version_match.group(1)} - {version_match.group(2)}"
-                elif "Run:" in meta_line:
-                    parts = meta_line.split("Run:")
-                    if len(parts) > 1:
-                        run_system_part = parts[1].strip()
-                        run_match = re.search(r'^(.*?)(?:\s+System:\s*(.*))?$', run_system_part)
-                        if run_match:
-                            metadata["Run"] = run_match.group(1).strip()
-                            if run_match.group(2):
-                                metadata["System"] = run_match.group(2).strip()
-                        else:
-                            metadata["Run"] = run_system_part
-                elif "Page" in meta_line:
-                    page_match = re.search(r'Page\s+(\d+)', meta_line)
-                    if page_match:
-                        metadata["Page"] = page_match.group(1).strip()
-        return metadata
+    def _get_column_schema(table_id, table_format):
+        """
+        Returns the (names, colspecs) pair for a table's 'columns' definition,
+        built once per table_id and cached alongside the format config.
+        Raises KeyError/TypeError if the definition is malformed.
+        """
+        schema = StopsPRNExtractor._column_schemas.get(table_id)
+        if schema is None:
+            columns_def = table_format["columns"]
+            names = [col["name"] for col in columns_def]
+            widths = [col["width"] for col in columns_def]
+            colspecs = StopsPRNExtractor._generate_colspecs_from_widths(widths)
+            schema = StopsPRNExtractor._column_schemas[table_id] = (names, colspecs)
+        return schema
 
     @staticmethod
-    def _extract_table_9_01_from_prn(file_path, table_id, config):
-        """Extractor for Table 9.01. Uses column definitions from JSON config."""
-        metadata = {}
-        actual_data_lines = []
-        in_table_section = False
-        start_of_table_data = -1
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-        except FileNotFoundError:
-            return pd.DataFrame(), {}
+    def _to_int32(values):
+        """
+        Casts numeric values (a Series, DataFrame or array with NaNs already
+        filled) to int32, half the size of the default int64. Falls back to
+        int64 if any value is outside the int32 range.
+        """
+        array = np.asarray(values)
+        if array.size and np.abs(array).max() > np.iinfo(np.int32).max:
+            return values.astype(np.int64)
+        return values.astype(np.int32)
 
-        for i, line in enumerate(lines):
-            if re.search(r"Table\s+" + re.escape(table_id), line):
-                in_table_section = True
-                metadata = StopsPRNExtractor._extract_metadata_from_prn(lines, i)
+    @staticmethod
+    def _parse_numeric_block(frame):
+        """
+        Parses every cell of a block of text columns to float with a single
+        pd.to_numeric call over the flattened values, rather than one call per
+        column. Values that cannot be parsed become 0. Returns a 2-D float array.
+        """
+        values = frame.to_numpy(dtype=object)
+        numbers = pd.to_numeric(values.ravel(), errors='coerce').astype(float).reshape(values.shape)
+        numbers[np.isnan(numbers)] = 0.0
+        return numbers
 
-            if in_table_section and start_of_table_data == -1:
-                if (re.search(r"Stop_id1.*WLK.*KNR", line) or re.search(r"Stop_id1", line)):
-                    if i + 1 < len(lines) and re.search(r"^=+", lines[i+1]):
-                        start_of_table_data = i + 2
-                        break
-        if start_of_table_data == -1:
-             return pd.DataFrame(), metadata
+    @staticmethod
+    def _read_fixed_width(data_lines, colspecs, names, text_columns=None):
+        """
+        Splits fixed-width data lines into a DataFrame of stripped strings, like
+        pd.read_fwf(..., dtype=str) but without its Python-level tokenizer. The
+        lines are padded into one NumPy character array and each column is cut
+        out as a single array slice. Empty fields become NaN.
+
+        If text_columns is given, every other column is parsed straight from its
+        slice to integers instead: thousands separators are removed and values
+        that cannot be parsed become 0.
+        """
+        row_width = max(end for _, end in colspecs)
+        padded = [line.rstrip('\r\n').ljust(row_width)[:row_width] for line in data_lines]
+        chars = np.array(padded, dtype=f'U{row_width}').view('U1').reshape(len(padded), row_width)
+
+        columns = {}
+        for (start, end), name in zip(colspecs, names):
+            field = np.ascontiguousarray(chars[:, start:end]).view(f'U{end - start}').ravel()
+            field = np.char.strip(field)
+            if text_columns is not None and name not in text_columns:
+                numbers = pd.Series(pd.to_numeric(np.char.replace(field, ',', ''), errors='coerce')).fillna(0)
+                columns[name] = StopsPRNExtractor._to_int32(numbers).to_numpy()
+                continue
+            column = field.astype(object)
+            column[field == ''] = np.nan
+            columns[name] = column
+        return pd.DataFrame(columns)
 
-        # REFACTORED: Get column definitions from the JSON config
-        format_config = StopsPRNExtractor._get_table_format_config(config)
-        table_format = format_config.get(table_id)
+    @staticmethod
+    def _label_total_row(df, name_column, id_column):
+        """
+        Labels the trailing summary row of a table: if its name cell reads
+        'total' in any letter case, both the name and ID cells are set to 'Total'.
+        """
+        if df.empty or name_column not in df.columns:
+            return
+        name_pos = df.columns.get_loc(name_column)
+        last_name = df.iat[-1, name_pos]
+        if isinstance(last_name, str) and last_name.strip().lower() == "total":
+            df.iloc[-1, [name_pos, df.columns.get_loc(id_column)]] = "Total"
+
+    @staticmethod
+    def _find_data_below_header(prn_file, table_id, is_header):
+        """
+        Shared locator for the tables whose data starts under a column header
+        line followed by a '====' rule. Scans from the table's title for the
+        first line where is_header(line) is true and returns
+        (index of the first data line, metadata), or (-1, metadata) if there is none.
+        """
+        lines = prn_file.lines
+        metadata = {}
+        for i, line, metadata in prn_file.iter_table_section(table_id):
+            if is_header(line):
+                if i + 1 < len(lines) and lines[i + 1].startswith("="):
+                    return i + 2, metadata
+        return -1, metadata
+
+    @staticmethod
+    def _collect_rows_to_total(prn_file, start_of_table_data):
+        """
+        Shared collector for the tables that end on a 'Total' row. Returns the
+        indexes of the data lines from start_of_table_data up to and including
+        the 'Total' line, or up to the next section break, skipping blank and
+        ruler lines.
+        """
+        lines = prn_file.lines
+        data_rows = []
+        # The section break line itself is still checked for 'Total' before stopping
+        end_of_section = prn_file.next_section_break(start_of_table_data)
+        for i in range(start_of_table_data, min(end_of_section + 1, len(lines))):
+            line_to_collect = lines[i]
+            if "Total" in line_to_collect:
+                data_rows.append(i)
+                return data_rows
+            if i == end_of_section:
+                break
+            stripped_line = line_to_collect.strip()
+            if stripped_line and not _is_ruler(stripped_line):
+                data_rows.append(i)
+        return data_rows
+
+    @staticmethod
+    def _load_column_schema(table_id, config):
+        """
+        Looks up a table's (names, colspecs) from the format config, printing an
+        error and returning None if its 'columns' definition is missing or malformed.
+        """
+        table_format = StopsPRNExtractor._get_table_format_config(config).get(table_id)
         try:
-            columns_def = table_format["columns"]
-            names = [col["name"] for col in columns_def]
-            widths = [col["width"] for col in columns_def]
-            colspecs = StopsPRNExtractor._generate_colspecs_from_widths(widths)
+            return StopsPRNExtractor._get_column_schema(table_id, table_format)
         except (KeyError, TypeError) as e:
             print(f"ERROR: Invalid 'columns' format for Table {table_id} in JSON: {e}")
-            return pd.DataFrame(), metadata
-        
-        for line_to_collect in lines[start_of_table_data:]:
-            if "Total" in line_to_collect:
-                actual_data_lines.append(line_to_collect.rstrip())
-                break
-            if re.search(r"Table\s+\d+\.\d+", line_to_collect) or (line_to_collect.strip() and "Program STOPS" in line_to_collect):
-                break
-            if line_to_collect.strip() and not re.fullmatch(r"={2,}", line_to_collect.strip()) and not re.fullmatch(r"-{2,}", line_to_collect.strip()):
-                actual_data_lines.append(line_to_collect.rstrip())
-        
-        if not actual_data_lines:
-            return pd.DataFrame(), metadata
+            return None
 
-        data_for_df = io.StringIO('\n'.join(actual_data_lines))
-        df = pd.read_fwf(data_for_df, colspecs=colspecs, header=None, names=names, dtype=str)
+    @staticmethod
+    def _extract_metadata_from_prn(lines, start_index):
+        """
+        Extracts metadata (Program, Version, Run, etc.) from the lines preceding a table.
+        Lines are scanned upwards from the table title, keeping the nearest value for
+        each key, and the scan stops as soon as every key has been found.
+        """
+        metadata = {}
+        for meta_line_num in range(start_index - 1, max(start_index - 10, -1), -1):
+            meta_line = lines[meta_line_num].strip()
+            if "Program STOPS" in meta_line:
+                # A page header line nearer the title already set both of its keys
+                if "Program" in metadata and "Version" in metadata:
+                    continue
+                program_version_parts = meta_line.split(" - ", 1)
+                if "Program" not in metadata:
+                    metadata["Program"] = program_version_parts[0].replace("Program ", "").strip()
+                if "Version" not in metadata and len(program_version_parts) > 1 and "Version:" in program_version_parts[1]:
+                    version_match = _RE_VERSION.search(program_version_parts[1])
+                    if version_match:
+                        metadata["Version"] = f"{version_match.group(1)} - {version_match.group(2)}"
+                    else:
+                        metadata["Version"] = program_version_parts[1].split("Version: ")[1].split(" - ")[0].strip()
+            elif "Version:" in meta_line:
+                if "Version" not in metadata:
+                    version_match = _RE_VERSION.search(meta_line)
+                    if version_match:
+                        metadata["Version"] = f"{version_match.group(1)} - {version_match.group(2)}"
+            elif "Run:" in meta_line:
+                if "Run" not in metadata:
+                    run_system_part = meta_line.split("Run:")[1].strip()
+                    run_match = _RE_RUN_SYSTEM.search(run_system_part)
+                    if run_match:
+                        metadata["Run"] = run_match.group(1).strip()
+                        if run_match.group(2):
+                            metadata["System"] = run_match.group(2).strip()
+                    else:
+                        metadata["Run"] = run_system_part
+            elif "Page" in meta_line:
+                if "Page" not in metadata:
+                    page_match = _RE_PAGE.search(meta_line)
+                    if page_match:
+                        metadata["Page"] = page_match.group(1).strip()
 
-        for col in df.columns:
-            if isinstance(df[col].dtype, object):
-                df[col] = df[col].str.strip()
-            if col not in ["Stop_id1", "Station_Name"]:
-                df[col] = pd.to_numeric(df[col].astype(str).str.replace(',', ''), errors='coerce').fillna(0).astype(int)
+            if metadata.keys() >= _METADATA_KEYS:
+                break
+        return metadata
 
-        if not df.empty and "Station_Name" in df.columns and pd.notna(df.iloc[-1]["Station_Name"]) and str(df.iloc[-1]["Station_Name"]).strip().lower() == "total":
-            df.at[df.index[-1], "Station_Name"] = "Total"
-            df.at[df.index[-1], "Stop_id1"] = "Total"
-        return df, metadata
-    
     @staticmethod
-    def _extract_table_10_01_from_prn(file_path, table_id, config):
-        """Extractor for Table 10.01. Uses column definitions from JSON config."""
-        metadata = {}
-        actual_data_lines = []
-        in_table_section = False
-        start_of_table_data = -1
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-        except FileNotFoundError:
+    def _extract_fixed_width_table(prn_file, table_id, config):
+        """
+        Generic extractor for fixed-width tables that sit under a '<header> + ===='
+        block and end on a 'Total' row (Tables 9.01, 10.01 and 10.05). Everything
+        table-specific comes from the table's JSON format definition:
+          - "header_marker": text the column header line must contain
+          - "header_pattern": optional regex the header line must also match
+          - "text_columns": columns kept as text; all others are parsed to integers
+          - "total_label_columns": [name column, ID column] labelled 'Total' on the last row
+        """
+        lines = prn_file.lines
+        table_format = StopsPRNExtractor._get_table_format_config(config).get(table_id) or {}
+        header_marker = table_format.get("header_marker")
+        if not header_marker:
+            print(f"ERROR: 'header_marker' not specified for Table {table_id} in JSON.")
             return pd.DataFrame(), {}
+        header_pattern = _header_pattern(table_format.get("header_pattern"))
 
-        for i, line in enumerate(lines):
-            if re.search(r"Table\s+" + re.escape(table_id), line):
-                in_table_section = True
-                metadata = StopsPRNExtractor._extract_metadata_from_prn(lines, i)
-            
-            if in_table_section and start_of_table_data == -1:
-                if (re.search(r"Route_ID.*WLK.*KNR", line) or re.search(r"Route_ID", line)):
-                    # Find the "====" separator line that follows the header
-                    if i + 1 < len(lines) and re.search(r"^=+", lines[i+1]):
-                        start_of_table_data = i + 2
-                        break
-        
+        start_of_table_data, metadata = StopsPRNExtractor._find_data_below_header(
+            prn_file, table_id,
+            lambda line: header_marker in line and (header_pattern is None or header_pattern.search(line))
+        )
         if start_of_table_data == -1:
             return pd.DataFrame(), metadata
-        
-        # REFACTORED: Get column definitions from the JSON config
-        format_config = StopsPRNExtractor._get_table_format_config(config)
-        table_format = format_config.get(table_id)
-        try:
-            columns_def = table_format["columns"]
-            names = [col["name"] for col in columns_def]
-            widths = [col["width"] for col in columns_def]
-            colspecs = StopsPRNExtractor._generate_colspecs_from_widths(widths)
-        except (KeyError, TypeError) as e:
-            print(f"ERROR: Invalid 'columns' format for Table {table_id} in JSON: {e}")
+
+        schema = StopsPRNExtractor._load_column_schema(table_id, config)
+        if schema is None:
             return pd.DataFrame(), metadata
-        
-        for line_to_collect in lines[start_of_table_data:]:
-            if "Total" in line_to_collect:
-                actual_data_lines.append(line_to_collect.rstrip())
-                break
-            if re.search(r"Table\s+\d+\.\d+", line_to_collect) or (line_to_collect.strip() and "Program STOPS" in line_to_collect):
-                break
-            if line_to_collect.strip() and not re.fullmatch(r"={2,}", line_to_collect.strip()) and not re.fullmatch(r"-{2,}", line_to_collect.strip()):
-                actual_data_lines.append(line_to_collect.rstrip())
-        
-        if not actual_data_lines:
+        names, colspecs = schema
+
+        data_rows = StopsPRNExtractor._collect_rows_to_total(prn_file, start_of_table_data)
+        if not data_rows:
             return pd.DataFrame(), metadata
-        
-        data_for_df = io.StringIO('\n'.join(actual_data_lines))
-        df = pd.read_fwf(data_for_df, colspecs=colspecs, header=None, names=names, dtype=str)
-
-        for col in df.columns:
-            if isinstance(df[col].dtype, object):
-                df[col] = df[col].str.strip()
-            # Infer which columns should be numeric based on name
-            if col not in ["Route_ID", "Route_Name", "Station_Name", "Stop_id1", "Group_Name", "HH_Cars", "Sub_mode", "Access_mode"]:
-                df[col] = pd.to_numeric(df[col].astype(str).str.replace(',', ''), errors='coerce').fillna(0).astype(int)
-
-        if not df.empty and "Route_Name" in df.columns and pd.notna(df.iloc[-1]["Route_Name"]) and str(df.iloc[-1]["Route_Name"]).strip().lower() == "total":
-            df.at[df.index[-1], "Route_Name"] = "Total"
-            df.at[df.index[-1], "Route_ID"] = "Total"
+
+        df = StopsPRNExtractor._read_fixed_width(
+            [lines[i] for i in data_rows], colspecs, names, text_columns=table_format.get("text_columns", [])
+        )
+
+        total_label_columns = table_format.get("total_label_columns")
+        if total_label_columns:
+            StopsPRNExtractor._label_total_row(df, *total_label_columns)
         return df, metadata
 
     @staticmethod
-    def _extract_table_10_02_from_prn(file_path, table_id, config):
+    def _extract_table_10_02_from_prn(prn_file, table_id, config):
         """Extractor for Table 10.02. Uses column definitions from JSON config and handles indented groups."""
-        metadata = {}
-        all_data_text = []
-        in_table_section = False
-        start_of_data = -1
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-        except FileNotFoundError:
-            return pd.DataFrame(), {}
-        
-        for i, line in enumerate(lines):
-            if re.search(r"Table\s+" + re.escape(table_id), line):
-                in_table_section = True
-                metadata = StopsPRNExtractor._extract_metadata_from_prn(lines, i)
-            
-            if in_table_section and start_of_data == -1:
-                if re.search(r"Route_ID.*Count", line):
-                    if i + 1 < len(lines) and re.search(r"^=+", lines[i + 1]):
-                        start_of_data = i + 2
-                        break
-        
+        lines = prn_file.lines
+        data_rows = []
+        start_of_data, metadata = StopsPRNExtractor._find_data_below_header(
+            prn_file, table_id, lambda line: "Route_ID" in line and _RE_ROUTE_COUNT_HEADER.search(line)
+        )
         if start_of_data == -1:
             return pd.DataFrame(), metadata
         
         # Get column definitions from the JSON config
-        format_config = StopsPRNExtractor._get_table_format_config(config)
-        table_format = format_config.get(table_id)
-        try:
-            columns_def = table_format["columns"]
-            names = [col["name"] for col in columns_def]
-            widths = [col["width"] for col in columns_def]
-            colspecs = StopsPRNExtractor._generate_colspecs_from_widths(widths)
-        except (KeyError, TypeError) as e:
-            print(f"ERROR: Invalid 'columns' format for Table {table_id} in JSON: {e}")
+        schema = StopsPRNExtractor._load_column_schema(table_id, config)
+        if schema is None:
             return pd.DataFrame(), metadata
+        names, colspecs = schema
 
         # MODIFIED: Robust data collection loop.
         # This loop now reads until the next table begins and filters out junk lines.
-        for line in lines[start_of_data:]:
-            # Stop processing ONLY if we hit the start of the next table or a new report page
-            if re.search(r"Table\s+\d+\.\d+", line) or re.search(r"Program STOPS", line):
-                break
-            
+        # Stop processing ONLY if we hit the start of the next table or a new report page
+        for i in range(start_of_data, prn_file.next_section_break(start_of_data)):
+            line = lines[i]
             # Filter out empty lines and separator lines (e.g., '====' or '----')
             stripped_line = line.strip()
-            if not stripped_line or re.fullmatch(r"[-=]{2,}", stripped_line):
+            if not stripped_line or (len(stripped_line) >= 2 and not stripped_line.strip("-=")):
                 continue
 
-            all_data_text.append(line)
+            data_rows.append(i)
         
-        if not all_data_text:
+        if not data_rows:
             return pd.DataFrame(), metadata
         
-        data_io = io.StringIO('\n'.join(all_data_text))
-        df = pd.read_fwf(data_io, colspecs=colspecs, header=None, names=names, dtype=str)
+        df = StopsPRNExtractor._read_fixed_width([lines[i] for i in data_rows], colspecs, names)
         
-        # Keep specialized cleanup logic for indented groups
-        df["Route_ID"] = df["Route_ID"].str.strip().replace('', pd.NA).ffill()
-        df['Route_Name'] = df['Group_Name'].apply(lambda x: x if pd.notna(x) and x.startswith('--') else pd.NA).ffill()
-        df.loc[df['Group_Name'].str.startswith('--', na=False), 'Group_Name'] = pd.NA
-        df["Group_Name"] = df["Group_Name"].str.strip().replace('', pd.NA)
-
-        is_total_header = df['Route_ID'].str.lower().str.strip() == 'total'
+        # Keep specialized cleanup logic for indented groups. Fields come back from
+        # the slicer already stripped, with blanks as NaN.
+        # Route headings are the '--' rows of Group_Name; one vectorized mask finds them
+        # for both the forward fill and the blanking, instead of a lambda per row.
+        is_route_heading = df['Group_Name'].str.startswith('--', na=False)
+        df["Route_ID"] = df["Route_ID"].ffill()
+        df['Route_Name'] = df['Group_Name'].where(is_route_heading).ffill()
+        df.loc[is_route_heading, 'Group_Name'] = pd.NA
+
+        is_total_header = df['Route_ID'].str.lower() == 'total'
         df.loc[is_total_header, 'Route_Name'] = 'Total'
         
-        is_total_group_name = df['Group_Name'].str.lower().str.strip() == 'total'
+        is_total_group_name = df['Group_Name'].str.lower() == 'total'
         df.loc[is_total_group_name, 'Group_Name'] = 'Total'
         df.loc[is_total_group_name, 'Route_Name'] = 'Total'
         
@@ -359,187 +603,71 @@ class StopsPRNExtractor:
             final_names_ordered = static_cols + dynamic_cols
             df = df[[col for col in final_names_ordered if col in df.columns]]
         
-        for col in df.columns:
-            if col not in ["Route_ID", "Route_Name", "Group_Name"]:
-                df[col] = pd.to_numeric(df[col].astype(str).str.replace(',', ''), errors='coerce')
+        # Convert every year column in one pass; blanks stay NaN
+        num_cols = [col for col in df.columns if col not in ["Route_ID", "Route_Name", "Group_Name"]]
+        if num_cols:
+            df[num_cols] = df[num_cols].replace(',', '', regex=True).apply(pd.to_numeric, errors='coerce')
 
         return df, metadata
     
     @staticmethod
-    def _extract_table_10_03_04_from_prn(file_path, table_id, config):
+    def _extract_table_10_03_04_from_prn(prn_file, table_id, config):
         """Extractor for Tables 10.03 & 10.04. Uses column definitions from JSON config."""
-        metadata = {}
-        actual_data_lines = []
-        in_table_section = False
-        start_of_table_data = -1
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-        except FileNotFoundError:
-            return pd.DataFrame(), {}
-
-        for i, line in enumerate(lines):
-            if re.search(r"Table\s+" + re.escape(table_id), line):
-                in_table_section = True
-                metadata = StopsPRNExtractor._extract_metadata_from_prn(lines, i)
-            
-            if in_table_section and start_of_table_data == -1:
-                if re.search(r"Route_ID.*Hours", line):
-                    if i + 1 < len(lines) and re.search(r"^=+", lines[i+1]):
-                        start_of_table_data = i + 2
-                        break
-        
+        lines = prn_file.lines
+        start_of_table_data, metadata = StopsPRNExtractor._find_data_below_header(
+            prn_file, table_id, lambda line: "Route_ID" in line and _RE_ROUTE_HOURS_HEADER.search(line)
+        )
         if start_of_table_data == -1:
             return pd.DataFrame(), metadata
-        
-        format_config = StopsPRNExtractor._get_table_format_config(config)
-        table_format = format_config.get(table_id)
-        try:
-            columns_def = table_format["columns"]
-            names = [col["name"] for col in columns_def]
-            widths = [col["width"] for col in columns_def]
-            colspecs = StopsPRNExtractor._generate_colspecs_from_widths(widths)
-        except (KeyError, TypeError) as e:
-            print(f"ERROR: Invalid 'columns' format for Table {table_id} in JSON: {e}")
+
+        schema = StopsPRNExtractor._load_column_schema(table_id, config)
+        if schema is None:
             return pd.DataFrame(), metadata
-        
-        for line_to_collect in lines[start_of_table_data:]:
-            if "Total" in line_to_collect:
-                actual_data_lines.append(line_to_collect.rstrip())
-                break
-            if re.search(r"Table\s+\d+\.\d+", line_to_collect) or (line_to_collect.strip() and "Program STOPS" in line_to_collect):
-                break
-            if line_to_collect.strip() and not re.fullmatch(r"={2,}", line_to_collect.strip()) and not re.fullmatch(r"-{2,}", line_to_collect.strip()):
-                actual_data_lines.append(line_to_collect.rstrip())
-        
-        if not actual_data_lines:
+        names, colspecs = schema
+
+        data_rows = StopsPRNExtractor._collect_rows_to_total(prn_file, start_of_table_data)
+        if not data_rows:
             return pd.DataFrame(), metadata
-        
-        data_for_df = io.StringIO('\n'.join(actual_data_lines))
+
         # FIX: Read all columns as strings first to prevent dtype inference errors.
-        df = pd.read_fwf(data_for_df, colspecs=colspecs, header=None, names=names, dtype=str)
+        df = StopsPRNExtractor._read_fixed_width([lines[i] for i in data_rows], colspecs, names)
 
         # FIX: Robustly clean and convert data types after ensuring all are strings.
-        for col in df.columns:
-            df[col] = df[col].str.strip()
-            
-            if "Miles" in col or "Hours" in col:
-                df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
-            elif col not in ["Route_ID", "Route_Name"]:
-                df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0).astype(int)
-
-        if not df.empty and pd.notna(df.iloc[-1]["Route_Name"]) and str(df.iloc[-1]["Route_Name"]).strip().lower() == "total":
-            df.at[df.index[-1], "Route_Name"] = "Total"
-            df.at[df.index[-1], "Route_ID"] = "Total"
+        # Miles/Hours columns keep their decimals; the other numeric columns are counts.
+        measure_cols = [col for col in df.columns if "Miles" in col or "Hours" in col]
+        count_cols = [col for col in df.columns if col not in measure_cols and col not in ["Route_ID", "Route_Name"]]
+        if measure_cols:
+            df[measure_cols] = df[measure_cols].apply(pd.to_numeric, errors='coerce').fillna(0)
+        if count_cols:
+            df[count_cols] = StopsPRNExtractor._to_int32(StopsPRNExtractor._parse_numeric_block(df[count_cols]))
+
+        StopsPRNExtractor._label_total_row(df, "Route_Name", "Route_ID")
         
         return df, metadata
 
     @staticmethod
-    def _extract_table_10_05_from_prn(file_path, table_id, config):
-        """Extractor for Table 10.05. Uses column definitions from JSON config."""
-        metadata = {}
-        actual_data_lines = []
-        in_table_section = False
-        start_of_table_data = -1
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-        except FileNotFoundError:
-            return pd.DataFrame(), {}
-
-        for i, line in enumerate(lines):
-            if re.search(r"Table\s+" + re.escape(table_id), line):
-                in_table_section = True
-                metadata = StopsPRNExtractor._extract_metadata_from_prn(lines, i)
-            
-            if in_table_section and start_of_table_data == -1:
-                if re.search(r"Route_ID.*ALL", line):
-                    if i + 1 < len(lines) and re.search(r"^=+", lines[i+1]):
-                        start_of_table_data = i + 2
-                        break
-        
-        if start_of_table_data == -1:
-            return pd.DataFrame(), metadata
-        
-        format_config = StopsPRNExtractor._get_table_format_config(config)
-        table_format = format_config.get(table_id)
-        try:
-            columns_def = table_format["columns"]
-            names = [col["name"] for col in columns_def]
-            widths = [col["width"] for col in columns_def]
-            colspecs = StopsPRNExtractor._generate_colspecs_from_widths(widths)
-        except (KeyError, TypeError) as e:
-            print(f"ERROR: Invalid 'columns' format for Table {table_id} in JSON: {e}")
-            return pd.DataFrame(), metadata
-        
-        for line_to_collect in lines[start_of_table_data:]:
-            if "Total" in line_to_collect:
-                actual_data_lines.append(line_to_collect.rstrip())
-                break
-            if re.search(r"Table\s+\d+\.\d+", line_to_collect) or (line_to_collect.strip() and "Program STOPS" in line_to_collect):
-                break
-            if line_to_collect.strip() and not re.fullmatch(r"={2,}", line_to_collect.strip()) and not re.fullmatch(r"-{2,}", line_to_collect.strip()):
-                actual_data_lines.append(line_to_collect.rstrip())
-        
-        if not actual_data_lines:
-            return pd.DataFrame(), metadata
-        
-        data_for_df = io.StringIO('\n'.join(actual_data_lines))
-        # FIX: Read all columns as strings first to prevent dtype inference errors.
-        df = pd.read_fwf(data_for_df, colspecs=colspecs, header=None, names=names, dtype=str)
-
-        # FIX: Robustly clean and convert data types.
-        for col in df.columns:
-            if isinstance(df[col].dtype, object):
-                df[col] = df[col].str.strip()
-            if col not in ["Route_ID", "Route_Name"]:
-                df[col] = pd.to_numeric(df[col].astype(str).str.replace(',', ''), errors='coerce').fillna(0).astype(int)
-
-        if not df.empty and "Route_Name" in df.columns and pd.notna(df.iloc[-1]["Route_Name"]) and str(df.iloc[-1]["Route_Name"]).strip().lower() == "total":
-            df.at[df.index[-1], "Route_Name"] = "Total"
-            df.at[df.index[-1], "Route_ID"] = "Total"
-        return df, metadata
-    @staticmethod
-    def _extract_table_12_01_from_prn(file_path, table_id, config):
+    def _extract_table_12_01_from_prn(prn_file, table_id, config):
         """Extractor for Table 12.01. Uses column definitions from JSON config."""
+        lines = prn_file.lines
         metadata = {}
         actual_data_lines = []
-        in_table_section = False
         start_of_table_data = -1
         
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-        except FileNotFoundError:
-            return pd.DataFrame(), {}
-
-        for i, line in enumerate(lines):
-            if re.search(r"Table\s+" + re.escape(table_id), line):
-                in_table_section = True
-                metadata = StopsPRNExtractor._extract_metadata_from_prn(lines, i)
-
-            if in_table_section and start_of_table_data == -1:
-                if (re.search(r"^={8,}", line)):
-                    start_of_table_data = i + 1
-                    break
+        for i, line, metadata in prn_file.iter_table_section(table_id):
+            if line.startswith("========"):
+                start_of_table_data = i + 1
+                break
         if start_of_table_data == -1:
              return pd.DataFrame(), metadata
 
-        format_config = StopsPRNExtractor._get_table_format_config(config)
-        table_format = format_config.get(table_id)
-        try:
-            columns_def = table_format["columns"]
-            names = [col["name"] for col in columns_def]
-            widths = [col["width"] for col in columns_def]
-            colspecs = StopsPRNExtractor._generate_colspecs_from_widths(widths)
-        except (KeyError, TypeError) as e:
-            print(f"ERROR: Invalid 'columns' format for Table {table_id} in JSON: {e}")
+        schema = StopsPRNExtractor._load_column_schema(table_id, config)
+        if schema is None:
             return pd.DataFrame(), metadata
+        names, colspecs = schema
         
-        for line_to_collect in lines[start_of_table_data:]:
-            stripped_line = line_to_collect.strip()
+        end_of_section = prn_file.next_section_break(start_of_table_data)
+        for i in range(start_of_table_data, min(end_of_section + 1, len(lines))):
+            stripped_line = lines[i].strip()
 
             # The Total line is the end of the data. Append it, then stop.
             if stripped_line.startswith("Total"):
@@ -547,7 +675,7 @@ class StopsPRNExtractor:
                 break
             
             # Stop if we hit the next table or a page header
-            if re.search(r"Table\s+\d+\.\d+", stripped_line) or "Program STOPS" in stripped_line:
+            if i == end_of_section:
                 break
                 
             if stripped_line:
@@ -556,47 +684,36 @@ class StopsPRNExtractor:
         if not actual_data_lines:
             return pd.DataFrame(), metadata
 
-        data_for_df = io.StringIO('\n'.join(actual_data_lines))
-        df = pd.read_fwf(data_for_df, colspecs=colspecs, header=None, names=names, dtype=str)
+        # The collected lines are sliced directly; no joined copy of the table is built
+        df = StopsPRNExtractor._read_fixed_width(actual_data_lines, colspecs, names)
 
-        for col in df.columns:
-            if df[col].dtype == 'object':
-                df[col] = df[col].str.strip()
-            if col not in ["District"]:
-                df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0).astype(float)
+        num_cols = [col for col in df.columns if col != "District"]
+        if num_cols:
+            df[num_cols] = StopsPRNExtractor._parse_numeric_block(df[num_cols])
 
         return df, metadata
 
     @staticmethod
-    def _extract_table_11_XX_from_prn(file_path, table_id, config):
+    def _extract_table_11_XX_from_prn(prn_file, table_id, config):
         """
         A function to extract tables 11.XX based on fixed-width format
         definitions provided in the prn_table_format_structure.json file.
         """
+        lines = prn_file.lines
         metadata = {}
-        data_text = []
-        in_table_section = False
+        data_rows = []
         start_of_data = -1
         
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-        except FileNotFoundError:
-            return pd.DataFrame(), {}
-
-        for i, line in enumerate(lines):
-            if re.search(r"Table\s+" + re.escape(table_id), line):
-                in_table_section = True
-                metadata = StopsPRNExtractor._extract_metadata_from_prn(lines, i)
-            
-            if in_table_section and start_of_data == -1:
-                if re.search(r"^[=-]+\s*.*", line.strip()) and i + 1 < len(lines):
-                    start_of_data = i + 1
-                    for j in range(start_of_data, min(start_of_data + 5, len(lines))):
-                        if lines[j].strip() and not re.search(r"^[=-]+\s*.*", lines[j].strip()):
-                            start_of_data = j
-                            break
-                    break
+        for i, line, metadata in prn_file.iter_table_section(table_id):
+            # A rule line is any stripped line starting with '=' or '-'
+            if line.strip().startswith(("=", "-")) and i + 1 < len(lines):
+                start_of_data = i + 1
+                for j in range(start_of_data, min(start_of_data + 5, len(lines))):
+                    next_stripped = lines[j].strip()
+                    if next_stripped and not next_stripped.startswith(("=", "-")):
+                        start_of_data = j
+                        break
+                break
         
         if start_of_data == -1:
             return pd.DataFrame(), metadata
@@ -609,75 +726,61 @@ class StopsPRNExtractor:
             return pd.DataFrame(), metadata
         
         try:
-            columns_def = table_format["columns"]
-            names = [col["name"] for col in columns_def]
-            widths = [col["width"] for col in columns_def]
-            colspecs = StopsPRNExtractor._generate_colspecs_from_widths(widths)
+            names, colspecs = StopsPRNExtractor._get_column_schema(table_id, table_format)
         except (KeyError, TypeError) as e:
             print(f"ERROR: Invalid fixed_width format definition for Table {table_id} in JSON: {e}")
             return pd.DataFrame(), metadata
 
-        for line in lines[start_of_data:]:
-            if re.search(r"Table\s+\d+\.\d+", line) or re.search(r"Program STOPS", line) or "..." in line:
+        for i in range(start_of_data, prn_file.next_section_break(start_of_data)):
+            line = lines[i]
+            if "..." in line:
                 break
-            if not line.strip() or re.fullmatch(r"[-=]+\s*.*", line.strip()):
+            stripped_line = line.strip()
+            if not stripped_line or stripped_line.startswith(("-", "=")):
                 continue
-            data_text.append(line.rstrip())
+            data_rows.append(i)
         
-        if not data_text:
+        if not data_rows:
             return pd.DataFrame(), metadata
         
-        data_io = io.StringIO('\n'.join(data_text))
-        
-        df = pd.read_fwf(data_io, colspecs=colspecs, header=None, names=names, dtype=str)
-
-        sep_cols = [col for col in df.columns if col.startswith('_sep')]
+        # Separator columns are left as text since they are dropped straight away
+        sep_cols = [name for name in names if name.startswith('_sep')]
+        df = StopsPRNExtractor._read_fixed_width(
+            [lines[i] for i in data_rows], colspecs, names, text_columns=["HH_Cars", "Sub_mode", "Access_mode"] + sep_cols
+        )
         df = df.drop(columns=sep_cols)
 
         # Specialized cleanup for Table 11.XX
-        df = df[~df['HH_Cars'].str.strip().str.startswith('. . .', na=False)].copy()
-        for col in df.columns:
-            if isinstance(df[col].dtype, object):
-                df[col] = df[col].str.strip()
-            if col not in ["HH_Cars", "Sub_mode", "Access_mode"]:
-                df[col] = pd.to_numeric(df[col].astype(str).str.replace(',', ''), errors='coerce').fillna(0).astype(int)
-        df['HH_Cars'] = df['HH_Cars'].mask(df['HH_Cars'].eq('')).ffill()
-        df['Sub_mode'] = df['Sub_mode'].mask(df['Sub_mode'].eq('')).ffill()
+        # Blank fields are already NaN from the slicer, so both columns fill forward in one
+        # call. assign() returns a new frame, so the filtered rows need no defensive copy.
+        df = df[~df['HH_Cars'].str.startswith('. . .', na=False)]
+        df = df.assign(**df[['HH_Cars', 'Sub_mode']].ffill())
 
         return df, metadata
 
     @staticmethod
-    def _extract_district_table(file_path, table_id, config):
+    def _extract_district_table(prn_file, table_id, config):
         """
         Extracts and pivots matrix-style 'District' tables using manual parsing.
         This version correctly handles the table's structure by separating the row
         header from the numeric data, avoiding the errors caused by pd.read_csv.
         """
+        lines = prn_file.lines
         metadata = {}
         data_lines = []
-        in_table_section = False
         header_line = None
         start_of_data = -1
 
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-        except FileNotFoundError:
-            return pd.DataFrame(), {}
-
         # 1. Find the start of the table, the header line, and the start of the data
-        for i, line in enumerate(lines):
+        for i, line, metadata in prn_file.iter_table_section(table_id):
             stripped_line = line.strip()
-            if re.search(r"Table\s+" + re.escape(table_id), line):
-                in_table_section = True
-                metadata = StopsPRNExtractor._extract_metadata_from_prn(lines, i)
             
             # FIX: Make header detection more specific. The header line must START with "Idist" or "District".
-            if in_table_section and header_line is None and (stripped_line.startswith("Idist")):
-            # if in_table_section and header_line is None and (stripped_line.startswith("Idist") or stripped_line.startswith("District")):
+            if header_line is None and (stripped_line.startswith("Idist")):
+            # if header_line is None and (stripped_line.startswith("Idist") or stripped_line.startswith("District")):
                 header_line = line
             
-            if header_line and re.search(r"^=+", stripped_line):
+            if header_line and stripped_line.startswith("="):
                 start_of_data = i + 1
                 break
         
@@ -692,11 +795,10 @@ class StopsPRNExtractor:
             headers[0] = "Origin_District"
         
         # 3. Collect the actual data lines, now including the "Total" summary row
-        for line in lines[start_of_data:]:
-            stripped_line = line.strip()
-
-            # Stop if we hit an empty line, a new table, or a page break
-            if not stripped_line or "Program STOPS" in line or re.search(r"Table\s+\d+\.\d+", line):
+        # Stop if we hit an empty line, a new table, or a page break
+        for i in range(start_of_data, prn_file.next_section_break(start_of_data)):
+            stripped_line = lines[i].strip()
+            if not stripped_line:
                 break
             
             data_lines.append(stripped_line)
@@ -729,15 +831,15 @@ class StopsPRNExtractor:
 
         df = pd.DataFrame(parsed_rows, columns=headers[:num_data_cols])
         
-        # 6. Convert data types
-        for col in df.columns:
-            if col != 'Origin_District':
-                df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0).astype(float)
+        # 6. Convert data types, all numeric columns in one to_numeric call
+        num_cols = [col for col in df.columns if col != 'Origin_District']
+        if num_cols:
+            df[num_cols] = StopsPRNExtractor._parse_numeric_block(df[num_cols])
 
         return df, metadata
 
     @staticmethod
-    def _extract_station_group_table(file_path, table_id, config):
+    def _extract_station_group_table(prn_file, table_id, config):
         """
         Dynamically extracts various "Station Group" table formats.
         This version uses a robust manual parsing method based on content type
@@ -745,31 +847,21 @@ class StopsPRNExtractor:
         Table 2.04 has special handling to include its summary rows (TOTAL, GOAL, COUNT).
         This version uses the numeric indices from the report as column headers and full text labels for rows.
         """
+        lines = prn_file.lines
         metadata = {}
-        in_table_section = False
         header_line_list = []
         separator_index = -1
         is_two_line_header = False
 
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-        except FileNotFoundError:
-            return pd.DataFrame(), {}
-
         # 1. FIND HEADERS AND DATA START
-        for i, line in enumerate(lines):
-            if re.search(r"Table\s+" + re.escape(table_id), line):
-                in_table_section = True
-                metadata = StopsPRNExtractor._extract_metadata_from_prn(lines, i)
-
-            if in_table_section and separator_index == -1 and re.search(r"^=+", line.strip()):
+        for i, line, metadata in prn_file.iter_table_section(table_id):
+            if separator_index == -1 and line.strip().startswith("="):
                 separator_index = i
                 if separator_index > 0:
                     header_line_list.insert(0, lines[separator_index - 1])
                 if separator_index > 1:
                     prev_line = lines[separator_index - 2].strip()
-                    if prev_line and not re.search(r"^=+", prev_line):
+                    if prev_line and not prev_line.startswith("="):
                         header_line_list.insert(0, lines[separator_index - 2])
                         is_two_line_header = True
                 break
@@ -801,10 +893,10 @@ class StopsPRNExtractor:
         if table_id != "2.04":
             stop_prefixes += ("TOTAL", "GOAL", "COUNT")
         
-        for line in lines[start_of_data:]:
-            stripped_line = line.strip()
+        for line_num in range(start_of_data, len(lines)):
+            stripped_line = lines[line_num].strip()
             
-            if not stripped_line or stripped_line.upper().startswith(stop_prefixes) or "Program STOPS" in line:
+            if not stripped_line or stripped_line.upper().startswith(stop_prefixes) or line_num in prn_file.page_header_lines:
                 break
             
             parts = stripped_line.split()
@@ -813,12 +905,9 @@ class StopsPRNExtractor:
             
             first_number_idx = -1
             for i, part in enumerate(parts):
-                try:
-                    float(part.replace(',', ''))
+                if _RE_NUMBER_TOKEN.fullmatch(part.replace(',', '')):
                     first_number_idx = i
-                    break 
-                except ValueError:
-                    continue
+                    break
 
             if first_number_idx != -1:
                 origin_group_raw = " ".join(parts[:first_number_idx])
@@ -851,20 +940,27 @@ class StopsPRNExtractor:
         else:
             df.columns = final_headers
 
-        # 6. CONVERT DATA TYPES AND CLEAN UP
-        for col in df.columns:
-            if col != 'Origin_Group':
-                df[col] = df[col].replace('-', pd.NA)
-                df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
+        # 6. CONVERT DATA TYPES AND CLEAN UP ('-' placeholders fail to parse and become 0)
+        num_cols = [col for col in df.columns if col != 'Origin_Group']
+        if num_cols:
+            df[num_cols] = df[num_cols].apply(pd.to_numeric, errors='coerce').fillna(0)
         
         df = df[df['Origin_Group'] != ''].reset_index(drop=True)
 
         return df, metadata
     
+# Table extraction functions keyed by the name used for "extraction_function" in
+# the format config, built once so lookups don't go through getattr.
+_EXTRACTION_FUNCTIONS = {
+    name: getattr(StopsPRNExtractor, name)
+    for name in vars(StopsPRNExtractor)
+    if name.startswith("_extract_") and name != "_extract_metadata_from_prn"
+}
+
 def get_extraction_method(table_id_str, config):
     """
-    Dynamically gets the extraction method based on the function name
-    specified in the JSON config file.
+    Gets the extraction method for a table from the function name specified
+    in the JSON config file.
     """
     format_config = StopsPRNExtractor._get_table_format_config(config)
     table_format = format_config.get(table_id_str)
@@ -878,15 +974,92 @@ def get_extraction_method(table_id_str, config):
         print(f"WARNING: 'extraction_function' not specified for Table {table_id_str} in config.")
         return None
 
-    try:
-        extraction_func = getattr(StopsPRNExtractor, function_name)
-        return extraction_func
-    except AttributeError:
+    extraction_func = _EXTRACTION_FUNCTIONS.get(function_name)
+    if extraction_func is None:
         print(f"ERROR: The function '{function_name}' specified for Table {table_id_str} does not exist in the StopsPRNExtractor class.")
-        return None
+    return extraction_func
+
+def _extract_tables_from_file(file_path, alias, resolved_tables, config):
+    """
+    Extracts every resolved (table ID, extraction method, output folder, filename
+    template) entry from a single PRN file and writes each table to its CSV. This
+    runs in a worker process, so everything it prints is captured and returned
+    for the caller to print, keeping each file's log together.
+
+    With 'write_combined_table_csvs' enabled, nothing is written here; the tables
+    are returned with an 'Alias' column as (output folder, DataFrame) pairs for
+    the caller to combine. Returns (log text, list of those pairs). If a table
+    fails, the log so far is printed and a RuntimeError naming the alias, file
+    and table is raised from the original error.
+    """
+    write_combined = config.get("write_combined_table_csvs", False)
+    combined_frames = []
+    log = io.StringIO()
+    # Kept up to date by the loop below so a failure can name the table it happened in
+    table_id_str = None
+    try:
+        with contextlib.redirect_stdout(log):
+            # Read the file once; every table extractor below works on the same PRNFile.
+            # Opening it is the existence check, so no separate stat() is needed.
+            try:
+                prn_file = PRNFile(file_path)
+            except FileNotFoundError:
+                print(f"❗️ WARNING: File not found for alias '{alias}': {file_path}. Skipping.")
+                return log.getvalue(), combined_frames
+
+            print(f"\nProcessing File: '{file_path.name}' (Alias: '{alias}')")
+
+            # Loop through the tables whose extraction methods were resolved up front
+            for table_id_str, extraction_func, table_output_dir, filename_template in resolved_tables:
+                print(f"  -> Attempting to extract Table {table_id_str}...")
+                df, metadata = extraction_func(prn_file, table_id_str, config)
+            
+                if df.empty:
+                    print(f"                     - No data found for Table {table_id_str} in this file.")
+                    continue
+
+                if write_combined:
+                    df.insert(0, 'Alias', alias)
+                    combined_frames.append((table_output_dir, df))
+                    print(f"                     ✅ Extracted {len(df)} rows for the combined table CSV")
+                    continue
+
+                # Create the output folder only for tables that produced rows
+                table_output_dir.mkdir(parents=True, exist_ok=True)
+
+                # Build output path from the config template
+                output_filename = filename_template.format(alias=alias)
+                output_path = table_output_dir / output_filename
+
+                df.to_csv(output_path, index=False)
+                print(f"                     ✅ Successfully saved to: {output_path}")
+    except Exception as e:
+        # The captured log would otherwise be lost with the exception; print what this
+        # file logged before the failure, then re-raise naming where it happened.
+        print(log.getvalue(), end="")
+        step = f"extracting Table {table_id_str}" if table_id_str else "reading the file"
+        raise RuntimeError(f"Failed while {step} for alias '{alias}' ({file_path}): {e}") from e
+    return log.getvalue(), combined_frames
+
+def select_files_to_process(config):
+    """
+    Returns the entries of 'files_to_process' whose alias is listed in
+    'aliases_to_extract', i.e. the PRN files an extraction run will read.
+    """
+    aliases_to_extract = config.get("aliases_to_extract") or []
+    return [
+        file_info for file_info in config.get("files_to_process", [])
+        if file_info.get("alias") in aliases_to_extract
+    ]
 
 def run_extraction(config):
-    """Main function to run the data extraction process from config."""
+    """
+    Main function to run the data extraction process from config.
+    PRN files are processed in parallel, using up to 'max_extraction_workers'
+    processes (defaults to the number of CPUs; 1 runs everything in-process).
+    If 'write_combined_table_csvs' is true, each table is written as one CSV
+    across all files instead of one CSV per alias.
+    """
     print("--- 🎬 Starting Data Extraction ---")
     
     # --- NEW: Handle DBF to CSV Conversion First ---
@@ -898,7 +1071,6 @@ def run_extraction(config):
     
     # MODIFIED: Get the list of specific aliases to extract from the config.
     aliases_to_extract = config.get("aliases_to_extract")
-    all_available_files = config.get("files_to_process", [])
     tables_to_extract_config = config.get("tables_to_extract", [])
 
     # NEW: Check if the aliases_to_extract list is provided and is not empty.
@@ -907,10 +1079,7 @@ def run_extraction(config):
         return
     
     # NEW: Filter the list of all files to only include those specified in 'aliases_to_extract'.
-    files_to_process = [
-        file_info for file_info in all_available_files
-        if file_info.get("alias") in aliases_to_extract
-    ]
+    files_to_process = select_files_to_process(config)
     
     print(f"ℹ️  Filtering PRN extraction for the following aliases: {aliases_to_extract}")
 
@@ -922,7 +1091,24 @@ def run_extraction(config):
         print("❗️ WARNING: No tables to extract were found in the configuration. Halting PRN extraction.")
         return
 
-    # This loop now iterates over the filtered list of files.
+    # Resolve each table's extraction method and output names once, rather than once per file.
+    resolved_tables = []
+    for output_config in tables_to_extract_config:
+        table_id_str = output_config['table_id']
+        extraction_func = get_extraction_method(table_id_str, config)
+        if not extraction_func:
+            print(f"❗️ WARNING: No extraction method found for Table {table_id_str}. It will be skipped for every file.")
+            continue
+        subfolder = output_config.get("output_subfolder", f"Table_{table_id_str.replace('.', '_')}")
+        filename_template = output_config.get("output_filename_template", f"[{{alias}}]__{table_id_str}.csv")
+        resolved_tables.append((table_id_str, extraction_func, output_base_dir / subfolder, filename_template))
+
+    if not resolved_tables:
+        print("❗️ WARNING: None of the tables to extract has a valid extraction method. Halting PRN extraction.")
+        return
+
+    # Resolve the path of each selected file; missing files are reported by the worker.
+    extraction_jobs = []
     for file_info in files_to_process:
         alias = file_info["alias"]
         filename = file_info["filename"]
@@ -932,39 +1118,38 @@ def run_extraction(config):
         else:
             file_path = base_prn_dir / filename
 
-        if not file_path.exists():
-            print(f"❗️ WARNING: File not found for alias '{alias}': {file_path}. Skipping.")
-            continue
-            
-        print(f"\nProcessing File: '{file_path.name}' (Alias: '{alias}')")
-
-        # Loop through the list of table configurations
-        for output_config in tables_to_extract_config:
-            table_id_str = output_config['table_id']
-            print(f"  -> Attempting to extract Table {table_id_str}...")
-            extraction_func = get_extraction_method(table_id_str, config)
-            
-            if not extraction_func:
-                print(f"                     - No extraction method found for Table {table_id_str}. Skipping.")
-                continue
-
-            df, metadata = extraction_func(str(file_path), table_id_str, config)
-            
-            if df.empty:
-                print(f"                     - No data found for Table {table_id_str} in this file.")
-                continue
-
-            # Build output path from the config templates
-            subfolder = output_config.get("output_subfolder", f"Table_{table_id_str.replace('.', '_')}")
-            filename_template = output_config.get("output_filename_template", f"[{alias}]__{table_id_str}.csv")
-            
-            table_output_dir = output_base_dir / subfolder
+        extraction_jobs.append((file_path, alias))
+
+    # Files are independent of each other, so they are extracted in parallel worker
+    # processes. Each worker's log is printed in file order once it finishes.
+    frames_by_output_dir = {}
+    def collect(result):
+        file_log, combined_frames = result
+        print(file_log, end="")
+        for table_output_dir, df in combined_frames:
+            frames_by_output_dir.setdefault(table_output_dir, []).append(df)
+
+    max_workers = min(config.get("max_extraction_workers") or os.cpu_count() or 1, len(extraction_jobs))
+    if max_workers <= 1:
+        for file_path, alias in extraction_jobs:
+            collect(_extract_tables_from_file(file_path, alias, resolved_tables, config))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_extract_tables_from_file, file_path, alias, resolved_tables, config)
+                for file_path, alias in extraction_jobs
+            ]
+            for future in futures:
+                collect(future.result())
+
+    # With 'write_combined_table_csvs', each table gets one CSV holding the rows of
+    # every file, tagged by alias, named after its folder (e.g. Table_9_01/Table_9_01.csv).
+    if frames_by_output_dir:
+        print("\nWriting combined table CSVs:")
+        for table_output_dir, frames in frames_by_output_dir.items():
             table_output_dir.mkdir(parents=True, exist_ok=True)
-            
-            output_filename = filename_template.format(alias=alias)
-            output_path = table_output_dir / output_filename
-
-            df.to_csv(output_path, index=False)
-            print(f"                     ✅ Successfully saved to: {output_path}")
+            output_path = table_output_dir / f"{table_output_dir.name}.csv"
+            pd.concat(frames, ignore_index=True).to_csv(output_path, index=False)
+            print(f"  ✅ Successfully saved to: {output_path}")
 
     print("\n--- ✅ Data Extraction Complete ---")
\ No newline at end of file
@@ -5,6 +5,10 @@ import re
 from pathlib import Path
 from pandasql import sqldf
 
+# Patterns applied to every report query, compiled once at import time
+_RE_TABLE_SPECIFIER = re.compile(r"\[\d+\.\d+\]")
+_RE_IN_LIST = re.compile(r'(\sIN\s*)\[(.*?)\]', flags=re.IGNORECASE)
+
 def run_reporting(config_manager):
     """
     Generates filtered CSV reports using pandasql to execute queries.
@@ -27,7 +31,7 @@ def run_reporting(config_manager):
         print(f"  SQL: {sql_string}")
 
         # MODIFICATION: Find all table specifiers (e.g., [11.01]) to support UNIONs.
-        table_specifiers = re.findall(r"\[\d+\.\d+\]", sql_string)
+        table_specifiers = _RE_TABLE_SPECIFIER.findall(sql_string)
         
         if not table_specifiers:
             print(f"  ❌ ERROR: Could not parse any table ID like '[X.XX]' from query: {sql_string}")
@@ -42,17 +46,29 @@ def run_reporting(config_manager):
             # Load from files if not already in our cache
             if table_id not in source_dataframes:
                 all_alias_dfs = []
-                for alias in aliases:
-                    filename = f"[{alias}]__{table_id}.csv"
-                    table_folder = f"Table_{table_id}"
-                    file_path = base_input_path / table_folder / filename
+                table_folder = f"Table_{table_id}"
+                combined_path = base_input_path / table_folder / f"{table_folder}.csv"
+
+                if combined_path.exists():
+                    # Extraction wrote one CSV for all aliases ('write_combined_table_csvs')
+                    combined_df = pd.read_csv(combined_path, dtype={'Alias': str})
+                    for alias in aliases:
+                        df = combined_df[combined_df['Alias'] == alias]
+                        if not df.empty:
+                            all_alias_dfs.append(df)
+                        else:
+                            print(f"  ⚠️ WARNING: No rows for alias '{alias}' in '{combined_path}'")
+                else:
+                    for alias in aliases:
+                        filename = f"[{alias}]__{table_id}.csv"
+                        file_path = base_input_path / table_folder / filename
 
-                    if file_path.exists():
-                        df = pd.read_csv(file_path)
-                        df.insert(0, 'Alias', alias)
-                        all_alias_dfs.append(df)
-                    else:
-                        print(f"  ⚠️ WARNING: Source file not found at '{file_path}'")
+                        if file_path.exists():
+                            df = pd.read_csv(file_path)
+                            df.insert(0, 'Alias', alias)
+                            all_alias_dfs.append(df)
+                        else:
+                            print(f"  ⚠️ WARNING: Source file not found at '{file_path}'")
                 
                 if not all_alias_dfs:
                     print(f"  ❌ ERROR: No source data found for table '{table_id}'.")
@@ -76,7 +92,7 @@ def run_reporting(config_manager):
             continue
 
         # This part remains the same
-        query_to_run = re.sub(r'(\sIN\s*)\[(.*?)\]', r'\1(\2)', query_to_run, flags=re.IGNORECASE)
+        query_to_run = _RE_IN_LIST.sub(r'\1(\2)', query_to_run)
 
         try:
             filtered_df = sqldf(query_to_run, globals())